@@ -2,6 +2,15 @@ import sys
 
 
 def main() -> int:
+    # Settle single-instance ownership before Qt is loaded, so a launch
+    # that has to replace (or gives up on) a running instance stays cheap
+    from src.log_setup import setup_logging
+    from src.single_instance import ensure_single_instance, release_mutex
+
+    setup_logging()
+    if not ensure_single_instance():
+        return 1
+
     from src.app import SoftDeckApp
 
     app = SoftDeckApp(sys.argv)
@@ -10,6 +19,7 @@ def main() -> int:
         exit_code = app.exec()
     finally:
         app.cleanup()
+        release_mutex()
 
     return exit_code
 
@@ -0,0 +1,87 @@
+"""Clipboard paste for text actions: put CF_UNICODETEXT on the clipboard, then Ctrl+V."""
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes
+
+from ._send_input import chord_array, send
+
+user32 = ctypes.windll.user32
+kernel32 = ctypes.windll.kernel32
+
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+# Text this module last put on the clipboard, and the clipboard sequence
+# number right after that write (it changes on any later clipboard change)
+_last_text: str | None = None
+_last_seq = 0
+
+kernel32.GlobalAlloc.argtypes = [ctypes.wintypes.UINT, ctypes.c_size_t]
+kernel32.GlobalAlloc.restype = ctypes.wintypes.HGLOBAL
+kernel32.GlobalLock.argtypes = [ctypes.wintypes.HGLOBAL]
+kernel32.GlobalLock.restype = ctypes.c_void_p
+kernel32.GlobalUnlock.argtypes = [ctypes.wintypes.HGLOBAL]
+kernel32.GlobalUnlock.restype = ctypes.wintypes.BOOL
+kernel32.GlobalFree.argtypes = [ctypes.wintypes.HGLOBAL]
+kernel32.GlobalFree.restype = ctypes.wintypes.HGLOBAL
+
+user32.OpenClipboard.argtypes = [ctypes.wintypes.HWND]
+user32.OpenClipboard.restype = ctypes.wintypes.BOOL
+user32.EmptyClipboard.argtypes = []
+user32.EmptyClipboard.restype = ctypes.wintypes.BOOL
+user32.SetClipboardData.argtypes = [ctypes.wintypes.UINT, ctypes.wintypes.HANDLE]
+user32.SetClipboardData.restype = ctypes.wintypes.HANDLE
+user32.CloseClipboard.argtypes = []
+user32.CloseClipboard.restype = ctypes.wintypes.BOOL
+user32.GetClipboardSequenceNumber.argtypes = []
+user32.GetClipboardSequenceNumber.restype = ctypes.wintypes.DWORD
+
+_CTRL_V = chord_array([(VK_CONTROL, 0), (VK_V, 0)])
+
+
+def _alloc_text(text: str) -> int:
+    """Movable global memory block holding text as NUL-terminated UTF-16."""
+    data = text.encode("utf-16-le") + b"\0\0"
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+    if not handle:
+        raise ctypes.WinError()
+    ptr = kernel32.GlobalLock(handle)
+    if not ptr:
+        kernel32.GlobalFree(handle)
+        raise ctypes.WinError()
+    ctypes.memmove(ptr, data, len(data))
+    kernel32.GlobalUnlock(handle)
+    return handle
+
+
+def set_clipboard_text(text: str) -> None:
+    handle = _alloc_text(text)
+    if not user32.OpenClipboard(None):
+        kernel32.GlobalFree(handle)
+        raise ctypes.WinError()
+    try:
+        user32.EmptyClipboard()
+        # On success the clipboard owns the memory block
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)
+            raise ctypes.WinError()
+    finally:
+        user32.CloseClipboard()
+
+
+def paste_text(text: str) -> None:
+    """Replace the clipboard with text and paste it into the focused window.
+
+    If the clipboard still holds our last write of the same text (its
+    sequence number hasn't moved), it is pasted as is, without another
+    Open/Empty/Set round trip.
+    """
+    global _last_text, _last_seq
+    if text != _last_text or user32.GetClipboardSequenceNumber() != _last_seq:
+        set_clipboard_text(text)
+        _last_text = text
+        _last_seq = user32.GetClipboardSequenceNumber()
+    send(_CTRL_V)
@@ -0,0 +1,24 @@
+"""Deferred import of the keyboard library.
+
+Importing keyboard is slow, and most sessions never send a key, so it is
+loaded on the first action that needs it instead of at app startup.
+"""
+from __future__ import annotations
+
+from types import ModuleType
+
+_keyboard: ModuleType | None = None
+
+
+def get_keyboard() -> ModuleType:
+    """Return the keyboard module, importing it on first use.
+
+    The library is patched so it never installs its WH_KEYBOARD_LL hook —
+    that hook interferes with our numpad_hook.exe even in a separate process.
+    """
+    global _keyboard
+    if _keyboard is None:
+        import keyboard
+        keyboard._listener.start_if_necessary = lambda: None
+        _keyboard = keyboard
+    return _keyboard
@@ -0,0 +1,186 @@
+"""Keyboard and mouse injection through Win32 SendInput."""
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes
+from collections.abc import Sequence
+from functools import lru_cache
+
+user32 = ctypes.windll.user32
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_MIDDLEDOWN = 0x0020
+MOUSEEVENTF_MIDDLEUP = 0x0040
+MOUSEEVENTF_XDOWN = 0x0080
+MOUSEEVENTF_XUP = 0x0100
+MOUSEEVENTF_WHEEL = 0x0800
+MOUSEEVENTF_HWHEEL = 0x1000
+WHEEL_DELTA = 120
+XBUTTON1 = 0x0001
+XBUTTON2 = 0x0002
+
+# Recorded button name (pynput Button names) → (down flags, up flags, mouseData)
+_BUTTONS = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP, 0),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP, 0),
+    "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP, 0),
+    "x1": (MOUSEEVENTF_XDOWN, MOUSEEVENTF_XUP, XBUTTON1),
+    "x2": (MOUSEEVENTF_XDOWN, MOUSEEVENTF_XUP, XBUTTON2),
+}
+
+MAPVK_VK_TO_VSC = 0
+
+VK_BACK = 0x08
+VK_RETURN = 0x0D
+
+# Characters apps expect as real key presses rather than as typed text
+_VK_FOR_CHAR = {
+    "\n": VK_RETURN,
+    "\b": VK_BACK,
+}
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk",         ctypes.wintypes.WORD),
+        ("wScan",       ctypes.wintypes.WORD),
+        ("dwFlags",     ctypes.wintypes.DWORD),
+        ("time",        ctypes.wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx",          ctypes.wintypes.LONG),
+        ("dy",          ctypes.wintypes.LONG),
+        ("mouseData",   ctypes.wintypes.DWORD),
+        ("dwFlags",     ctypes.wintypes.DWORD),
+        ("time",        ctypes.wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+user32.SendInput.argtypes = [
+    ctypes.wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int,
+]
+user32.SendInput.restype = ctypes.wintypes.UINT
+user32.MapVirtualKeyW.argtypes = [ctypes.wintypes.UINT, ctypes.wintypes.UINT]
+user32.MapVirtualKeyW.restype = ctypes.wintypes.UINT
+user32.SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+user32.SetCursorPos.restype = ctypes.wintypes.BOOL
+
+
+def key_event(vk: int = 0, scan: int = 0, flags: int = 0) -> INPUT:
+    return INPUT(
+        type=INPUT_KEYBOARD,
+        u=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)),
+    )
+
+
+def mouse_event(flags: int, data: int = 0) -> INPUT:
+    # mouseData is a DWORD; wheel deltas are signed
+    return INPUT(
+        type=INPUT_MOUSE,
+        u=_INPUTUNION(mi=_MOUSEINPUT(mouseData=data & 0xFFFFFFFF, dwFlags=flags)),
+    )
+
+
+def input_array(events: Sequence[INPUT]) -> ctypes.Array:
+    """Copy events into the contiguous INPUT array SendInput takes."""
+    return (INPUT * len(events))(*events)
+
+
+def chord_array(keys: Sequence[tuple[int, int]]) -> ctypes.Array:
+    """Events for a key chord: (vk, flags) pairs pressed in order, released in reverse.
+
+    Scan codes are filled in too, for apps that read those instead of the VK.
+    """
+    keys = [(vk, user32.MapVirtualKeyW(vk, MAPVK_VK_TO_VSC), flags) for vk, flags in keys]
+    events = [key_event(vk, scan, flags) for vk, scan, flags in keys]
+    events += [
+        key_event(vk, scan, flags | KEYEVENTF_KEYUP) for vk, scan, flags in reversed(keys)
+    ]
+    return input_array(events)
+
+
+def send(events: Sequence[INPUT] | ctypes.Array) -> None:
+    """Inject all events with a single SendInput call.
+
+    A prebuilt INPUT array (see input_array()) is sent without copying.
+    """
+    count = len(events)
+    if not count:
+        return
+    batch = events if isinstance(events, ctypes.Array) else input_array(events)
+    if user32.SendInput(count, batch, ctypes.sizeof(INPUT)) != count:
+        # Blocked (e.g. UIPI: the foreground app runs elevated)
+        raise ctypes.WinError()
+
+
+@lru_cache(maxsize=512)
+def _char_events(ch: str) -> tuple[INPUT, ...]:
+    """Key down/up events for one character, built once per distinct character."""
+    vk = _VK_FOR_CHAR.get(ch)
+    if vk:
+        return key_event(vk=vk), key_event(vk=vk, flags=KEYEVENTF_KEYUP)
+    events: list[INPUT] = []
+    data = ch.encode("utf-16-le")
+    for i in range(0, len(data), 2):
+        unit = int.from_bytes(data[i:i + 2], "little")
+        events.append(key_event(scan=unit, flags=KEYEVENTF_UNICODE))
+        events.append(key_event(
+            scan=unit, flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP,
+        ))
+    return tuple(events)
+
+
+def text_events(text: str) -> list[INPUT]:
+    """Key down/up pairs that type text, one UTF-16 code unit at a time."""
+    events: list[INPUT] = []
+    for ch in text.replace("\r\n", "\n"):
+        events.extend(_char_events(ch))
+    return events
+
+
+def type_text(text: str) -> None:
+    """Type text in one batch, independent of keyboard layout and IME state."""
+    send(text_events(text))
+
+
+def set_cursor_pos(x: int, y: int) -> None:
+    if not user32.SetCursorPos(int(x), int(y)):
+        raise ctypes.WinError()
+
+
+def mouse_button(name: str, down: bool) -> None:
+    """Press or release a button by name; unknown names act on the left button."""
+    down_flags, up_flags, data = _BUTTONS.get(name, _BUTTONS["left"])
+    send((mouse_event(down_flags if down else up_flags, data),))
+
+
+def mouse_scroll(dx: int, dy: int) -> None:
+    """Scroll by whole wheel notches (positive dy = up, positive dx = right)."""
+    events = []
+    if dy:
+        events.append(mouse_event(MOUSEEVENTF_WHEEL, int(dy * WHEEL_DELTA)))
+    if dx:
+        events.append(mouse_event(MOUSEEVENTF_HWHEEL, int(dx * WHEEL_DELTA)))
+    send(events)
@@ -0,0 +1,42 @@
+"""Long-lived background thread for actions that inject input."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SerialWorker:
+    """Runs submitted calls one at a time, in order, on one daemon thread.
+
+    Replaces a new thread per button press. Input from one action type is
+    never interleaved. The thread is daemonic, like the per-call threads it
+    replaces, so an unfinished macro does not hold up app exit.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._queue: queue.SimpleQueue[tuple[Callable[..., Any], tuple]] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True,
+                )
+                self._thread.start()
+        self._queue.put((fn, args))
+
+    def _run(self) -> None:
+        while True:
+            fn, args = self._queue.get()
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("%s: task failed", self._name)
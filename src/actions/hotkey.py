@@ -1,29 +1,79 @@
 from __future__ import annotations
 
+import ctypes
 import logging
 import threading
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
-import keyboard
-
+from ._lazy_keyboard import get_keyboard
+from ._send_input import KEYEVENTF_EXTENDEDKEY, chord_array, send
 from .base import ActionBase
 
 logger = logging.getLogger(__name__)
 
+# Hotkeys that Windows blocks from keyboard simulation — handled via direct API calls
+_SPECIAL_HOTKEYS: dict[str, Callable[[], object]] = {
+    "win+l": lambda: ctypes.windll.user32.LockWorkStation(),
+}
 
-class HotkeyAction(ActionBase):
-    # Hotkeys that Windows blocks from keyboard simulation — handled via direct API calls
-    _SPECIAL_HOTKEYS: dict[str, object] = {}
+# Chords sent often enough to keep a ready-made SendInput array for each
+_PREBUILT_CHORDS = (
+    "ctrl+a", "ctrl+c", "ctrl+f", "ctrl+n", "ctrl+s", "ctrl+t", "ctrl+v",
+    "ctrl+w", "ctrl+x", "ctrl+y", "ctrl+z", "ctrl+tab", "ctrl+shift+tab",
+    "ctrl+shift+t", "ctrl+shift+esc", "alt+tab", "alt+f4",
+    "win+d", "win+e", "win+r", "win+tab", "win+shift+s",
+)
 
-    @classmethod
-    def _init_special(cls) -> None:
-        if cls._SPECIAL_HOTKEYS:
-            return
-        import ctypes
-        cls._SPECIAL_HOTKEYS = {
-            "win+l": lambda: ctypes.windll.user32.LockWorkStation(),
-        }
+# Key name → (virtual-key code, KEYEVENTF flags); single letters map to their VK directly
+_CHORD_KEYS = {
+    "ctrl": (0x11, 0),
+    "shift": (0x10, 0),
+    "alt": (0x12, 0),
+    "win": (0x5B, KEYEVENTF_EXTENDEDKEY),
+    "tab": (0x09, 0),
+    "esc": (0x1B, 0),
+    "f4": (0x73, 0),
+}
+
+_PREBUILT = {
+    chord: chord_array([
+        _CHORD_KEYS.get(name) or (ord(name.upper()), 0) for name in chord.split("+")
+    ])
+    for chord in _PREBUILT_CHORDS
+}
+
+
+# Whitespace dropped when matching hotkey strings against the lookup tables
+_NORMALIZE_TABLE = str.maketrans("", "", " \t")
+
+
+@lru_cache(maxsize=256)
+def _normalize(keys: str) -> str:
+    """Lookup key for _SPECIAL_HOTKEYS / _PREBUILT ("Ctrl + C" → "ctrl+c")."""
+    return keys.translate(_NORMALIZE_TABLE).lower()
 
+
+@lru_cache(maxsize=128)
+def _parse_hotkey(keys: str) -> tuple:
+    """Parse a hotkey string to scan-code steps once per distinct string.
+
+    keyboard.send() passes an already-parsed hotkey through unchanged.
+    """
+    return get_keyboard().parse_hotkey(keys)
+
+
+def send_hotkey(keys: str) -> None:
+    """Press and release a hotkey, from a prebuilt SendInput array when there is one."""
+    prebuilt = _PREBUILT.get(_normalize(keys))
+    if prebuilt is not None:
+        send(prebuilt)
+    else:
+        get_keyboard().send(_parse_hotkey(keys))
+
+
+class HotkeyAction(ActionBase):
     def execute(self, params: dict[str, Any]) -> None:
         keys = params.get("keys", "")
         if not keys:
@@ -34,12 +84,11 @@ class HotkeyAction(ActionBase):
 
     def _send(self, keys: str) -> None:
         try:
-            self._init_special()
-            handler = self._SPECIAL_HOTKEYS.get(keys.lower().replace(" ", ""))
+            handler = _SPECIAL_HOTKEYS.get(_normalize(keys))
             if handler:
                 handler()
             else:
-                keyboard.send(keys)
+                send_hotkey(keys)
             logger.info("Sent hotkey: %s", keys)
         except Exception:
             logger.exception("Failed to send hotkey: %s", keys)
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import logging
-import threading
 import time
+from functools import lru_cache
 from typing import Any
 
-import keyboard
-
+from ._send_input import mouse_button, mouse_scroll, set_cursor_pos
+from ._worker import SerialWorker
 from .base import ActionBase
+from .hotkey import send_hotkey
+from .text_input import send_text
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
 def _resolve_pynput_key(key_name: str, vk: int) -> Any:
-    """Resolve a recorded key name + vk code to a pynput Key or KeyCode."""
+    """Resolve a recorded key name + vk code to a pynput Key or KeyCode.
+
+    Cached: recorded macros replay the same few keys over and over, and the
+    resolved Key/KeyCode objects are immutable.
+    """
     from pynput.keyboard import Key, KeyCode
 
     # Try named key first (e.g. 'shift', 'ctrl_l', 'space')
@@ -33,113 +40,135 @@ def _resolve_pynput_key(key_name: str, vk: int) -> Any:
     return None
 
 
-def _resolve_mouse_button(name: str) -> Any:
-    """Resolve a button name to a pynput mouse.Button."""
-    from pynput.mouse import Button
+def _merge_delays(steps: list[dict[str, Any]]) -> list[tuple[int, dict[str, Any]]]:
+    """Pair steps with their index, summing each run of consecutive delays into one.
 
-    return getattr(Button, name, Button.left)
+    Recorded macros are full of back-to-back short delays; one sleep for the
+    total avoids paying the per-sleep overhead for each of them. The merged
+    step keeps the index of the first delay in the run for logging.
+    """
+    merged: list[tuple[int, dict[str, Any]]] = []
+    for i, step in enumerate(steps):
+        if step.get("type") == "delay" and merged and merged[-1][1].get("type") == "delay":
+            first, prev = merged[-1]
+            ms = prev.get("params", {}).get("ms", 100) + step.get("params", {}).get("ms", 100)
+            merged[-1] = (first, {"type": "delay", "params": {"ms": ms}})
+        else:
+            merged.append((i, step))
+    return merged
 
 
 class MacroAction(ActionBase):
+    # pynput keyboard controller — created on first use, shared by every macro run
+    _kb_controller: Any = None
+    # Macros run one after another on a single background thread
+    _worker = SerialWorker("macro")
+    # Cursor position the running macro last set (None: unknown). Only
+    # touched on the worker thread
+    _cursor: tuple[int, int] | None = None
+
+    @classmethod
+    def _keyboard(cls) -> Any:
+        if cls._kb_controller is None:
+            from pynput.keyboard import Controller
+            cls._kb_controller = Controller()
+        return cls._kb_controller
+
     def execute(self, params: dict[str, Any]) -> None:
         steps = params.get("steps", [])
         if not steps:
             logger.warning("macro: no steps defined")
             return
 
-        threading.Thread(target=self._run_steps, args=(steps,), daemon=True).start()
+        self._worker.submit(self._run_steps, steps)
 
     def _run_steps(self, steps: list[dict[str, Any]]) -> None:
-        for i, step in enumerate(steps):
+        # Cursor position this run last set; the user may have moved it since
+        # the previous run, so never carry it over
+        self._cursor = None
+        for i, step in _merge_delays(steps):
             step_type = step.get("type", "")
-            step_params = step.get("params", {})
+            handler = self._STEP_HANDLERS.get(step_type)
+            if handler is None:
+                logger.warning("Macro step %d: unknown type '%s'", i, step_type)
+                continue
             try:
-                if step_type == "hotkey":
-                    keys = step_params.get("keys", "")
-                    if keys:
-                        keyboard.send(keys)
-                        logger.info("Macro step %d: sent hotkey %s", i, keys)
-                elif step_type == "text_input":
-                    text = step_params.get("text", "")
-                    if text:
-                        if step_params.get("use_clipboard", False):
-                            self._paste_via_clipboard(text)
-                        else:
-                            keyboard.write(text, delay=0.02)
-                        logger.info("Macro step %d: text input (%d chars)", i, len(text))
-                elif step_type == "delay":
-                    ms = step_params.get("ms", 100)
-                    time.sleep(ms / 1000)
-                    logger.info("Macro step %d: delay %dms", i, ms)
-                elif step_type == "key_down":
-                    self._do_key_down(step_params)
-                    logger.info("Macro step %d: key_down %s", i, step_params.get("key"))
-                elif step_type == "key_up":
-                    self._do_key_up(step_params)
-                    logger.info("Macro step %d: key_up %s", i, step_params.get("key"))
-                elif step_type == "mouse_down":
-                    self._do_mouse_down(step_params)
-                    logger.info("Macro step %d: mouse_down %s @ (%s,%s)", i,
-                                step_params.get("button"), step_params.get("x"), step_params.get("y"))
-                elif step_type == "mouse_up":
-                    self._do_mouse_up(step_params)
-                    logger.info("Macro step %d: mouse_up %s @ (%s,%s)", i,
-                                step_params.get("button"), step_params.get("x"), step_params.get("y"))
-                elif step_type == "mouse_scroll":
-                    self._do_mouse_scroll(step_params)
-                    logger.info("Macro step %d: mouse_scroll @ (%s,%s) d(%s,%s)", i,
-                                step_params.get("x"), step_params.get("y"),
-                                step_params.get("dx"), step_params.get("dy"))
-                else:
-                    logger.warning("Macro step %d: unknown type '%s'", i, step_type)
+                handler(self, step.get("params", {}), i)
             except Exception:
                 logger.exception("Macro step %d failed (type=%s)", i, step_type)
 
-    @staticmethod
-    def _paste_via_clipboard(text: str) -> None:
-        import win32clipboard
-        win32clipboard.OpenClipboard()
-        try:
-            win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
-        finally:
-            win32clipboard.CloseClipboard()
-        keyboard.send("ctrl+v")
-
-    @staticmethod
-    def _do_key_down(params: dict[str, Any]) -> None:
-        from pynput.keyboard import Controller
+    def _step_hotkey(self, params: dict[str, Any], i: int) -> None:
+        keys = params.get("keys", "")
+        if keys:
+            send_hotkey(keys)
+            logger.info("Macro step %d: sent hotkey %s", i, keys)
+
+    def _step_text_input(self, params: dict[str, Any], i: int) -> None:
+        text = params.get("text", "")
+        if text:
+            send_text(text, params.get("use_clipboard", False), params.get("delay_ms", 0))
+            logger.info("Macro step %d: text input (%d chars)", i, len(text))
+
+    def _step_delay(self, params: dict[str, Any], i: int) -> None:
+        ms = params.get("ms", 100)
+        time.sleep(ms / 1000)
+        # The user may have moved the mouse while we slept
+        self._cursor = None
+        logger.info("Macro step %d: delay %dms", i, ms)
+
+    def _step_key_down(self, params: dict[str, Any], i: int) -> None:
         key = _resolve_pynput_key(params.get("key", ""), params.get("vk", 0))
         if key is not None:
-            Controller().press(key)
+            self._keyboard().press(key)
+        logger.info("Macro step %d: key_down %s", i, params.get("key"))
 
-    @staticmethod
-    def _do_key_up(params: dict[str, Any]) -> None:
-        from pynput.keyboard import Controller
+    def _step_key_up(self, params: dict[str, Any], i: int) -> None:
         key = _resolve_pynput_key(params.get("key", ""), params.get("vk", 0))
         if key is not None:
-            Controller().release(key)
-
-    @staticmethod
-    def _do_mouse_down(params: dict[str, Any]) -> None:
-        from pynput.mouse import Controller
-        mc = Controller()
-        mc.position = (params.get("x", 0), params.get("y", 0))
-        mc.press(_resolve_mouse_button(params.get("button", "left")))
-
-    @staticmethod
-    def _do_mouse_up(params: dict[str, Any]) -> None:
-        from pynput.mouse import Controller
-        mc = Controller()
-        mc.position = (params.get("x", 0), params.get("y", 0))
-        mc.release(_resolve_mouse_button(params.get("button", "left")))
-
-    @staticmethod
-    def _do_mouse_scroll(params: dict[str, Any]) -> None:
-        from pynput.mouse import Controller
-        mc = Controller()
-        mc.position = (params.get("x", 0), params.get("y", 0))
-        mc.scroll(params.get("dx", 0), params.get("dy", 0))
+            self._keyboard().release(key)
+        logger.info("Macro step %d: key_up %s", i, params.get("key"))
+
+    def _step_mouse_down(self, params: dict[str, Any], i: int) -> None:
+        self._move_to(params)
+        mouse_button(params.get("button", "left"), down=True)
+        logger.info("Macro step %d: mouse_down %s @ (%s,%s)", i,
+                    params.get("button"), params.get("x"), params.get("y"))
+
+    def _step_mouse_up(self, params: dict[str, Any], i: int) -> None:
+        self._move_to(params)
+        mouse_button(params.get("button", "left"), down=False)
+        logger.info("Macro step %d: mouse_up %s @ (%s,%s)", i,
+                    params.get("button"), params.get("x"), params.get("y"))
+
+    def _step_mouse_scroll(self, params: dict[str, Any], i: int) -> None:
+        self._move_to(params)
+        mouse_scroll(params.get("dx", 0), params.get("dy", 0))
+        logger.info("Macro step %d: mouse_scroll @ (%s,%s) d(%s,%s)", i,
+                    params.get("x"), params.get("y"),
+                    params.get("dx"), params.get("dy"))
+
+    def _move_to(self, params: dict[str, Any]) -> None:
+        """Place the cursor for a mouse step.
+
+        Skipped when the last mouse step left it at the same point and no
+        delay has run since.
+        """
+        pos = (params.get("x", 0), params.get("y", 0))
+        if pos != self._cursor:
+            set_cursor_pos(*pos)
+            self._cursor = pos
+
+    # Step type → handler, resolved with one dict lookup per step
+    _STEP_HANDLERS = {
+        "hotkey": _step_hotkey,
+        "text_input": _step_text_input,
+        "delay": _step_delay,
+        "key_down": _step_key_down,
+        "key_up": _step_key_up,
+        "mouse_down": _step_mouse_down,
+        "mouse_up": _step_mouse_up,
+        "mouse_scroll": _step_mouse_scroll,
+    }
 
     def get_display_text(self, params: dict[str, Any]) -> str | None:
         steps = params.get("steps", [])
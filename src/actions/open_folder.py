@@ -2,12 +2,27 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from functools import lru_cache
 from typing import Any
 
 from .base import ActionBase
 
 logger = logging.getLogger(__name__)
 
+_RESOLVE_TTL_S = 30
+
+
+@lru_cache(maxsize=64)
+def _resolve(path: str, _bucket: int) -> tuple[str, bool]:
+    """Expanded path and whether it is a directory.
+
+    *_bucket* is the current TTL window, so entries are reused for repeat
+    clicks but re-checked every _RESOLVE_TTL_S seconds.
+    """
+    expanded = os.path.expandvars(os.path.expanduser(path))
+    return expanded, os.path.isdir(expanded)
+
 
 class OpenFolderAction(ActionBase):
     def execute(self, params: dict[str, Any]) -> None:
@@ -16,8 +31,9 @@ class OpenFolderAction(ActionBase):
             logger.warning("open_folder: no path specified")
             return
 
-        path = os.path.expandvars(os.path.expanduser(path))
-        if not os.path.isdir(path):
+        path, is_dir = _resolve(path, int(time.monotonic() // _RESOLVE_TTL_S))
+        # A cached miss may be stale (folder created since) — check it again
+        if not is_dir and not os.path.isdir(path):
             logger.warning("open_folder: path is not a directory: %s", path)
             return
 
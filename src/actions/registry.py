@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from .base import ActionBase
@@ -11,6 +12,8 @@ logger = logging.getLogger(__name__)
 class ActionRegistry:
     def __init__(self) -> None:
         self._actions: dict[str, ActionBase] = {}
+        # Lazily registered types: constructed by get_action() on first use
+        self._factories: dict[str, Callable[[], ActionBase]] = {}
         self._main_window = None
 
     def set_main_window(self, window) -> None:
@@ -21,11 +24,18 @@ class ActionRegistry:
         return self._main_window
 
     def register(self, action_type: str, action: ActionBase) -> None:
+        self._factories.pop(action_type, None)
         self._actions[action_type] = action
         logger.debug("Registered action: %s", action_type)
 
+    def register_lazy(self, action_type: str, factory: Callable[[], ActionBase]) -> None:
+        """Register an action that is only constructed when first needed."""
+        self._actions.pop(action_type, None)
+        self._factories[action_type] = factory
+        logger.debug("Registered action (lazy): %s", action_type)
+
     def execute(self, action_type: str, params: dict[str, Any]) -> None:
-        action = self._actions.get(action_type)
+        action = self.get_action(action_type)
         if action is None:
             logger.warning("Unknown action type: %s", action_type)
             return
@@ -35,7 +45,7 @@ class ActionRegistry:
             logger.exception("Action %s failed with params %s", action_type, params)
 
     def get_display_text(self, action_type: str, params: dict[str, Any]) -> str | None:
-        action = self._actions.get(action_type)
+        action = self.get_action(action_type)
         if action is None:
             return None
         try:
@@ -44,4 +54,17 @@ class ActionRegistry:
             return None
 
     def get_action(self, action_type: str) -> ActionBase | None:
-        return self._actions.get(action_type)
+        action = self._actions.get(action_type)
+        if action is None:
+            # Popped before the call so a failing factory is tried (and its
+            # traceback logged) once rather than on every refresh
+            factory = self._factories.pop(action_type, None)
+            if factory is None:
+                return None
+            try:
+                action = factory()
+            except Exception:
+                logger.exception("Failed to create action: %s", action_type)
+                return None
+            self._actions[action_type] = action
+        return action
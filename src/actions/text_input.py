@@ -1,17 +1,38 @@
 from __future__ import annotations
 
 import logging
-import threading
 from typing import Any
 
-import keyboard
-
+from ._clipboard import paste_text
+from ._lazy_keyboard import get_keyboard
+from ._send_input import type_text
+from ._worker import SerialWorker
 from .base import ActionBase
 
 logger = logging.getLogger(__name__)
 
+# Shorter text is typed even in clipboard mode — the clipboard round trip
+# plus the target app's paste handling costs more than a short SendInput batch
+_CLIPBOARD_THRESHOLD = 16
+
+
+def send_text(text: str, use_clipboard: bool = False, delay_ms: int = 0) -> str:
+    """Deliver text to the focused window and return the method used."""
+    if use_clipboard and len(text) >= _CLIPBOARD_THRESHOLD:
+        paste_text(text)
+        return "clipboard"
+    if delay_ms:
+        # Per-key pacing for apps that drop fast input
+        get_keyboard().write(text, delay=delay_ms / 1000)
+    else:
+        type_text(text)
+    return "typing"
+
 
 class TextInputAction(ActionBase):
+    # Text inputs are delivered one after another on a single background thread
+    _worker = SerialWorker("text_input")
+
     def execute(self, params: dict[str, Any]) -> None:
         text = params.get("text", "")
         if not text:
@@ -19,32 +40,15 @@ class TextInputAction(ActionBase):
             return
 
         use_clipboard = params.get("use_clipboard", False)
-        threading.Thread(
-            target=self._send, args=(text, use_clipboard), daemon=True,
-        ).start()
+        delay_ms = params.get("delay_ms", 0)
+        self._worker.submit(self._send, text, use_clipboard, delay_ms)
 
-    def _send(self, text: str, use_clipboard: bool) -> None:
+    def _send(self, text: str, use_clipboard: bool, delay_ms: int = 0) -> None:
         try:
-            if use_clipboard:
-                self._paste_via_clipboard(text)
-            else:
-                keyboard.write(text, delay=0.02)
-            logger.info("Text input sent (%s): %s...",
-                        "clipboard" if use_clipboard else "typing",
-                        text[:30])
+            method = send_text(text, use_clipboard, delay_ms)
+            logger.info("Text input sent (%s): %s...", method, text[:30])
         except Exception:
             logger.exception("Failed to send text input")
 
-    @staticmethod
-    def _paste_via_clipboard(text: str) -> None:
-        import win32clipboard
-        win32clipboard.OpenClipboard()
-        try:
-            win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardText(text, win32clipboard.CF_UNICODETEXT)
-        finally:
-            win32clipboard.CloseClipboard()
-        keyboard.send("ctrl+v")
-
     def get_display_text(self, params: dict[str, Any]) -> str | None:
         return None
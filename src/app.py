@@ -1,36 +1,26 @@
 from __future__ import annotations
 
 import ctypes
+import ctypes.wintypes
+import importlib
 import logging
 import os
 from pathlib import Path
-import sys
+import threading
 import time
+from collections.abc import Callable
 
-import psutil
-
-# Prevent the keyboard library from ever installing a WH_KEYBOARD_LL hook.
-# Its hook interferes with our numpad_hook.exe even in a separate process.
-import keyboard as _kb
-_kb._listener.start_if_necessary = lambda: None
-
-from PyQt6.QtCore import QEasingCurve, QParallelAnimationGroup, QPoint, QPropertyAnimation, Qt, QTimer
+from PyQt6.QtCore import (
+    QEasingCurve, QParallelAnimationGroup, QPoint, QPropertyAnimation, Qt, QTimer, pyqtSignal,
+)
 from PyQt6.QtGui import QColor, QLinearGradient, QPainter, QPixmap
 from PyQt6.QtWidgets import QApplication, QSplashScreen
 
 from .config.manager import ConfigManager
+from .actions.base import ActionBase
 from .actions.registry import ActionRegistry
-from .actions.launch_app import LaunchAppAction
-from .actions.hotkey import HotkeyAction
-from .actions.system_monitor import SystemMonitorAction
-from .actions.navigate import NavigateBackAction, NavigateFolderAction, NavigateParentAction
-from .actions.text_input import TextInputAction
-from .actions.macro import MacroAction
-from .actions.open_url import OpenUrlAction
-from .actions.open_folder import OpenFolderAction
-from .actions.run_command import RunCommandAction
 from .services.system_stats import SystemStatsService
-from .services.window_monitor import ActiveWindowMonitor
+from .services.window_monitor import ActiveWindowMonitor, foreground_pid, process_exe_name
 
 from .services.input_detector import InputDetector
 from .ui.main_window import MainWindow
@@ -38,35 +28,69 @@ from .ui.tray_icon import TrayIcon
 from .ui.styles import get_theme
 from .ui.toast import ToastManager
 from .plugins.loader import PluginLoader
+from .single_instance import QUIT_EVENT_NAME
+from .version import APP_VERSION
 
 _ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 
 logger = logging.getLogger(__name__)
 
-_MUTEX_NAME = "SoftDeck_SingleInstance"
+_OWN_PID = os.getpid()
+
+_INFINITE = 0xFFFFFFFF
+_WAIT_OBJECT_0 = 0
+
+_kernel32 = ctypes.windll.kernel32
+_kernel32.CreateEventW.argtypes = [
+    ctypes.c_void_p, ctypes.wintypes.BOOL, ctypes.wintypes.BOOL, ctypes.wintypes.LPCWSTR,
+]
+_kernel32.CreateEventW.restype = ctypes.wintypes.HANDLE
+_kernel32.WaitForSingleObject.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+_kernel32.WaitForSingleObject.restype = ctypes.wintypes.DWORD
+
+
+def _lazy_action(module: str, class_name: str, *args: object) -> Callable[[], ActionBase]:
+    """Factory importing src.actions.<module> only when the action is first built."""
+    def factory() -> ActionBase:
+        action_cls = getattr(importlib.import_module(f".actions.{module}", __package__), class_name)
+        return action_cls(*args)
+    return factory
 
 
 class SoftDeckApp(QApplication):
+    # Emitted from the quit-request thread; handled on the main thread
+    _quit_requested = pyqtSignal()
+
     def __init__(self, argv: list[str]) -> None:
         super().__init__(argv)
         self.setApplicationName("SoftDeck")
         self.setQuitOnLastWindowClosed(False)
 
-        self._instance_mutex = None
-        self._setup_logging()
-
-        # Single instance: kill existing process if running
-        self._ensure_single_instance()
+        # Logging and the single-instance mutex are set up by main()
+        # before Qt is imported; only the quit-request listener needs Qt
+        self._listen_for_quit_request()
 
         # Splash screen
         self._splash = self._create_splash()
         self._splash.show()
         self._splash_shown_at = time.monotonic()
-        self.processEvents()
 
-        # Config
+        # Config — read and parsed on a worker while the splash paints;
+        # nothing touches the manager until _deferred_init() joins it
         self._config_manager = ConfigManager()
-        self._config_manager.load()
+        self._config_loader = threading.Thread(
+            target=self._config_manager.load, name="config-load", daemon=True,
+        )
+        self._config_loader.start()
+        self.processEvents()
+        self._transition_group = None
+
+        # Everything else runs once the event loop is up, so the splash is
+        # on screen while actions, plugins and the main window are built
+        QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self) -> None:
+        self._config_loader.join()
 
         # Resolve theme
         self._theme = get_theme(self._config_manager.settings.theme)
@@ -95,9 +119,8 @@ class SoftDeckApp(QApplication):
         self._action_registry.set_main_window(self._main_window)
         self._main_window.set_toast_manager(self._toast_manager)
 
-        # Tray
-        self._tray_icon = TrayIcon(self._main_window)
-        self._tray_icon.show()
+        # Tray — built once this init pass has returned to the event loop
+        QTimer.singleShot(0, self._init_tray)
 
         # Services
         self._start_services()
@@ -113,60 +136,42 @@ class SoftDeckApp(QApplication):
         if not self._should_show_window:
             logger.info("Num Lock is ON at startup — window hidden")
 
-        # Ready feedback (deferred — splash transition then show window)
-        self._transition_group = None
+        # Ready feedback (splash transition then show window)
         self._notify_ready()
 
-    def _setup_logging(self) -> None:
-        log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-        handlers: list[logging.Handler] = []
-
-        # File log — always works, even in --windowed exe (no stdout)
-        log_dir = os.path.join(
-            os.environ.get("APPDATA", "."), "SoftDeck"
-        )
-        os.makedirs(log_dir, exist_ok=True)
-        file_handler = logging.FileHandler(
-            os.path.join(log_dir, "app.log"), encoding="utf-8"
-        )
-        file_handler.setFormatter(logging.Formatter(log_format))
-        handlers.append(file_handler)
-
-        # Console log — only when stdout exists (not --windowed exe)
-        if sys.stdout is not None:
-            handlers.append(logging.StreamHandler(sys.stdout))
-
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=handlers,
-        )
+    def _init_tray(self) -> None:
+        self._tray_icon = TrayIcon(self._main_window)
+        self._tray_icon.show()
 
     def _register_actions(self) -> None:
-        self._action_registry.register("launch_app", LaunchAppAction())
-        self._action_registry.register("hotkey", HotkeyAction())
-        self._action_registry.register("text_input", TextInputAction())
-        self._action_registry.register("macro", MacroAction())
-        self._action_registry.register("system_monitor", SystemMonitorAction())
-        self._action_registry.register("open_url", OpenUrlAction())
-        self._action_registry.register("open_folder", OpenFolderAction())
-        self._action_registry.register("run_command", RunCommandAction())
-
-        nav_action = NavigateFolderAction(self._action_registry)
-        self._action_registry.register("navigate_folder", nav_action)
-        # Backward compat: old configs with navigate_page type
-        self._action_registry.register("navigate_page", nav_action)
-
-        nav_parent = NavigateParentAction(self._action_registry)
-        self._action_registry.register("navigate_parent", nav_parent)
-
-        nav_back = NavigateBackAction(self._action_registry)
-        self._action_registry.register("navigate_back", nav_back)
+        # Built-in actions are imported and constructed on first use
+        for action_type, (module, class_name) in {
+            "launch_app": ("launch_app", "LaunchAppAction"),
+            "hotkey": ("hotkey", "HotkeyAction"),
+            "text_input": ("text_input", "TextInputAction"),
+            "macro": ("macro", "MacroAction"),
+            "system_monitor": ("system_monitor", "SystemMonitorAction"),
+            "open_url": ("open_url", "OpenUrlAction"),
+            "open_folder": ("open_folder", "OpenFolderAction"),
+            "run_command": ("run_command", "RunCommandAction"),
+        }.items():
+            self._action_registry.register_lazy(action_type, _lazy_action(module, class_name))
+
+        # Navigation actions need the registry to reach the main window
+        registry = self._action_registry
+        for action_type, class_name in {
+            "navigate_folder": "NavigateFolderAction",
+            # Backward compat: old configs with navigate_page type
+            "navigate_page": "NavigateFolderAction",
+            "navigate_parent": "NavigateParentAction",
+            "navigate_back": "NavigateBackAction",
+        }.items():
+            registry.register_lazy(action_type, _lazy_action("navigate", class_name, registry))
 
     def _load_plugins(self) -> None:
         self._plugin_loader.discover_and_load()
         for action_type, plugin in self._plugin_loader.plugins.items():
-            self._action_registry.register(action_type, plugin.create_action())
+            self._action_registry.register_lazy(action_type, plugin.create_action)
         from .ui.default_icons import set_plugin_icon_resolver
         set_plugin_icon_resolver(self._plugin_loader.get_icon_path)
 
@@ -175,11 +180,14 @@ class SoftDeckApp(QApplication):
         self._stats_service = SystemStatsService(interval_ms=2000)
         self._stats_service.stats_updated.connect(self._main_window.update_monitor_button)
         self._main_window.set_system_stats_service(self._stats_service)
+        # Sampling follows main window visibility (show/hide events)
+        if not self._main_window.isVisible():
+            self._stats_service.pause()
         self._stats_service.start()
 
         # Window monitor
         if self._config_manager.settings.auto_switch_enabled:
-            self._window_monitor = ActiveWindowMonitor(interval_ms=300)
+            self._window_monitor = ActiveWindowMonitor()
             self._window_monitor.active_app_changed.connect(self._on_active_app_changed)
             self._main_window.set_window_monitor(self._window_monitor)
             self._window_monitor.start()
@@ -188,9 +196,7 @@ class SoftDeckApp(QApplication):
 
         # Media playback monitor
         self._playback_monitor = None
-        self._mute_timer = None
-        self._mic_mute_timer = None
-        self._device_name_timer = None
+        self._audio_poll_timer = None
         media_plugin = self._plugin_loader.plugins.get("media_control")
         if media_plugin is not None:
             monitor = media_plugin.get_playback_monitor()
@@ -200,30 +206,30 @@ class SoftDeckApp(QApplication):
                 monitor.start()
                 self._playback_monitor = monitor
                 logger.info("Media playback monitor started")
-            # Mute state polling (main-thread QTimer to avoid COM threading issues)
             service = media_plugin.get_service()
             if service is not None:
-                self._last_mute_state = service.is_muted()
                 self._mute_service = service
-                self._mute_timer = QTimer()
-                self._mute_timer.timeout.connect(self._poll_mute_state)
-                self._mute_timer.start(500)
-                logger.info("Mute state polling started")
-
-                # Mic mute state polling
-                self._last_mic_mute_state = service.is_mic_muted()
-                self._mic_mute_timer = QTimer()
-                self._mic_mute_timer.timeout.connect(self._poll_mic_mute_state)
-                self._mic_mute_timer.start(500)
-                logger.info("Mic mute state polling started")
-
-                # Audio device name polling
-                self._last_device_name = service.get_current_audio_output_name()
+                snapshot = service.get_audio_snapshot()
+                self._last_mute_state = snapshot.muted
+                self._last_mic_mute_state = snapshot.mic_muted
+                self._last_device_name = snapshot.device_name
                 self._main_window.update_device_name(self._last_device_name)
-                self._device_name_timer = QTimer()
-                self._device_name_timer.timeout.connect(self._poll_device_name)
-                self._device_name_timer.start(2000)
-                logger.info("Audio device name polling started")
+
+                # Core Audio change notifications; fall back to polling
+                watcher = media_plugin.get_endpoint_watcher()
+                if watcher is not None:
+                    watcher.mute_changed.connect(self._on_mute_changed)
+                    watcher.mic_mute_changed.connect(self._on_mic_mute_changed)
+                    watcher.device_name_changed.connect(self._on_device_name_changed)
+                if watcher is not None and watcher.start():
+                    logger.info("Audio state notifications registered")
+                else:
+                    # Main-thread QTimer to avoid COM threading issues
+                    self._audio_poll_tick = 0
+                    self._audio_poll_timer = QTimer()
+                    self._audio_poll_timer.timeout.connect(self._poll_audio)
+                    self._audio_poll_timer.start(500)
+                    logger.info("Audio state polling started")
 
     def _on_numlock_changed(self, is_on: bool) -> None:
         """Hide window when Num Lock is ON, show when OFF."""
@@ -245,17 +251,12 @@ class SoftDeckApp(QApplication):
         if self._window_monitor is None:
             return
         try:
-            import win32gui
-            import win32process
-
-            hwnd = win32gui.GetForegroundWindow()
-            if not hwnd:
+            pid = foreground_pid()
+            if not pid or pid == _OWN_PID:
                 return
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            if not pid or pid == os.getpid():
+            exe_name = process_exe_name(pid)
+            if not exe_name:
                 return
-            proc = psutil.Process(pid)
-            exe_name = proc.name()
             folder = self._config_manager.find_folder_for_app(exe_name)
             if folder is not None:
                 self._main_window.switch_to_folder_id(folder.id)
@@ -277,11 +278,21 @@ class SoftDeckApp(QApplication):
             media_plugin._is_playing = is_playing
         self._main_window.update_media_state(is_playing)
 
-    def _poll_mute_state(self) -> None:
+    def _poll_audio(self) -> None:
+        # Mute states every tick (500 ms), the device name every 4th (2 s)
+        self._audio_poll_tick = (self._audio_poll_tick + 1) % 4
         try:
-            muted = self._mute_service.is_muted()
+            snapshot = self._mute_service.get_audio_snapshot(
+                with_device_name=self._audio_poll_tick == 0,
+            )
         except Exception:
             return
+        self._on_mute_changed(snapshot.muted)
+        self._on_mic_mute_changed(snapshot.mic_muted)
+        if snapshot.device_name is not None:
+            self._on_device_name_changed(snapshot.device_name)
+
+    def _on_mute_changed(self, muted: bool) -> None:
         if muted != self._last_mute_state:
             self._last_mute_state = muted
             media_plugin = self._plugin_loader.plugins.get("media_control")
@@ -289,11 +300,7 @@ class SoftDeckApp(QApplication):
                 media_plugin._is_muted = muted
             self._main_window.update_mute_state(muted)
 
-    def _poll_mic_mute_state(self) -> None:
-        try:
-            muted = self._mute_service.is_mic_muted()
-        except Exception:
-            return
+    def _on_mic_mute_changed(self, muted: bool) -> None:
         if muted != self._last_mic_mute_state:
             self._last_mic_mute_state = muted
             media_plugin = self._plugin_loader.plugins.get("media_control")
@@ -304,11 +311,7 @@ class SoftDeckApp(QApplication):
     def _on_track_info_changed(self, text: str, thumbnail: bytes = b"") -> None:
         self._main_window.update_now_playing(text, thumbnail)
 
-    def _poll_device_name(self) -> None:
-        try:
-            name = self._mute_service.get_current_audio_output_name()
-        except Exception:
-            return
+    def _on_device_name_changed(self, name: str) -> None:
         if name != self._last_device_name:
             self._last_device_name = name
             self._main_window.update_device_name(name)
@@ -316,7 +319,8 @@ class SoftDeckApp(QApplication):
     def _notify_ready(self) -> None:
         """Wait for minimum splash time, then start transition animation."""
         remaining_ms = 0
-        if self._splash is not None:
+        # Window starts hidden (Num Lock ON): no transition to wait for
+        if self._splash is not None and self._should_show_window:
             _SPLASH_MIN_SECONDS = 3.0
             elapsed = time.monotonic() - self._splash_shown_at
             remaining_ms = max(0, int((_SPLASH_MIN_SECONDS - elapsed) * 1000))
@@ -340,8 +344,7 @@ class SoftDeckApp(QApplication):
         if settings.window_x is not None and settings.window_y is not None:
             target_pos = QPoint(settings.window_x, settings.window_y)
         else:
-            from PyQt6.QtGui import QGuiApplication
-            screen = QGuiApplication.primaryScreen()
+            screen = self.primaryScreen()
             geo = screen.availableGeometry()
             margin = 12
             target_pos = QPoint(
@@ -410,8 +413,49 @@ class SoftDeckApp(QApplication):
     # ------------------------------------------------------------------
 
     def _create_splash(self) -> QSplashScreen:
-        from .version import APP_VERSION
+        splash = QSplashScreen(self._load_splash_pixmap())
+        splash.setWindowFlags(
+            Qt.WindowType.SplashScreen
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.FramelessWindowHint,
+        )
+        splash.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        return splash
+
+    def _load_splash_pixmap(self) -> QPixmap:
+        """Splash image, rendered on first run of each version and cached as a PNG."""
+        icon_path = _ASSETS_DIR / "트레이아이콘후보1.png"
+        cache_path = Path(
+            os.environ.get("APPDATA", "."), "SoftDeck", f"splash-v{APP_VERSION}.png",
+        )
+        try:
+            fresh = cache_path.stat().st_mtime_ns >= icon_path.stat().st_mtime_ns
+        except OSError:
+            fresh = False
+        if fresh:
+            pixmap = QPixmap(str(cache_path))
+            if not pixmap.isNull():
+                return pixmap
+
+        pixmap = self._render_splash(APP_VERSION, icon_path)
+        # On first run the config thread may not have created the folder yet
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+        if not pixmap.save(str(cache_path), "PNG"):
+            logger.warning("Failed to cache splash image at %s", cache_path)
+            return pixmap
+        # Images for earlier versions are never read again
+        for stale in cache_path.parent.glob("splash-v*.png"):
+            if stale != cache_path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    logger.debug("Failed to remove old splash image %s", stale)
+        return pixmap
 
+    def _render_splash(self, version: str, icon_path: Path) -> QPixmap:
         size = 280
         icon_size = 128
         pixmap = QPixmap(size, size)
@@ -429,7 +473,6 @@ class SoftDeckApp(QApplication):
         painter.drawRoundedRect(0, 0, size, size, 20, 20)
 
         # Icon
-        icon_path = _ASSETS_DIR / "트레이아이콘후보1.png"
         if icon_path.exists():
             icon_pm = QPixmap(str(icon_path)).scaled(
                 icon_size, icon_size,
@@ -453,7 +496,7 @@ class SoftDeckApp(QApplication):
         font.setBold(False)
         painter.setFont(font)
         painter.setPen(QColor("#888888"))
-        painter.drawText(0, 210, size, 20, Qt.AlignmentFlag.AlignCenter, f"v{APP_VERSION}")
+        painter.drawText(0, 210, size, 20, Qt.AlignmentFlag.AlignCenter, f"v{version}")
 
         # Loading
         font.setPixelSize(11)
@@ -462,65 +505,32 @@ class SoftDeckApp(QApplication):
         painter.drawText(0, 245, size, 20, Qt.AlignmentFlag.AlignCenter, "Loading...")
 
         painter.end()
-
-        splash = QSplashScreen(pixmap)
-        splash.setWindowFlags(
-            Qt.WindowType.SplashScreen
-            | Qt.WindowType.WindowStaysOnTopHint
-            | Qt.WindowType.FramelessWindowHint,
-        )
-        splash.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        return splash
+        return pixmap
 
     # ------------------------------------------------------------------
     # Single-instance helpers
     # ------------------------------------------------------------------
 
-    def _acquire_mutex(self) -> bool:
-        kernel32 = ctypes.windll.kernel32
-        handle = kernel32.CreateMutexW(None, False, _MUTEX_NAME)
-        if kernel32.GetLastError() == 183:  # ERROR_ALREADY_EXISTS
-            kernel32.CloseHandle(handle)
-            return False
-        self._instance_mutex = handle
-        return True
-
-    def _kill_existing(self) -> None:
-        my_pid = os.getpid()
-        for proc in psutil.process_iter(["pid", "name"]):
-            try:
-                if proc.pid == my_pid:
-                    continue
-                name = proc.info["name"] or ""
-                if name.lower() == "softdeck.exe":
-                    proc.terminate()
-                    proc.wait(timeout=3)
-                    logger.info("Terminated existing PID %d", proc.pid)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-            except psutil.TimeoutExpired:
-                try:
-                    proc.kill()
-                    logger.info("Force-killed existing PID %d", proc.pid)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-
-    def _ensure_single_instance(self) -> None:
-        if self._acquire_mutex():
+    def _listen_for_quit_request(self) -> None:
+        handle = _kernel32.CreateEventW(None, False, False, QUIT_EVENT_NAME)
+        if not handle:
+            logger.warning("Failed to create quit-request event")
             return
-
-        logger.info("Another instance detected — terminating it")
-        self._kill_existing()
-
-        for _ in range(20):
-            time.sleep(0.25)
-            self.processEvents()
-            if self._acquire_mutex():
-                logger.info("Mutex acquired after killing existing process")
-                return
-
-        logger.error("Failed to acquire mutex after killing existing process")
-        sys.exit(1)
+        # Left open for the life of the process; the waiting thread uses it
+        self._quit_requested.connect(self._on_quit_requested)
+        threading.Thread(
+            target=self._wait_for_quit_request, args=(handle,),
+            name="quit-request", daemon=True,
+        ).start()
+
+    def _wait_for_quit_request(self, handle: int) -> None:
+        if _kernel32.WaitForSingleObject(handle, _INFINITE) == _WAIT_OBJECT_0:
+            self._quit_requested.emit()
+
+    def _on_quit_requested(self) -> None:
+        logger.info("Quit requested by a newer instance")
+        # exit() rather than quit(): MainWindow refuses close events
+        self.exit(0)
 
     # ------------------------------------------------------------------
     # Input mode switching
@@ -559,6 +569,3 @@ class SoftDeckApp(QApplication):
             self._playback_monitor.stop()
         if hasattr(self, "_plugin_loader"):
             self._plugin_loader.shutdown_all()
-        if self._instance_mutex:
-            ctypes.windll.kernel32.CloseHandle(self._instance_mutex)
-            self._instance_mutex = None
@@ -30,6 +30,9 @@ class ConfigManager:
     def __init__(self) -> None:
         self._config: AppConfig = AppConfig()
         self._path = _USER_CONFIG_PATH
+        # Lowercased exe name → mapped folder; rebuilt on first lookup
+        # after a load or save (every config mutation ends in save())
+        self._app_folders: dict[str, FolderConfig] | None = None
 
     @property
     def config(self) -> AppConfig:
@@ -44,6 +47,7 @@ class ConfigManager:
         return self._config.root_folder
 
     def load(self) -> AppConfig:
+        self._app_folders = None
         if self._path.exists():
             try:
                 data = json.loads(self._path.read_text(encoding="utf-8"))
@@ -87,6 +91,7 @@ class ConfigManager:
         return self._config
 
     def save(self) -> None:
+        self._app_folders = None
         self._path.parent.mkdir(parents=True, exist_ok=True)
 
         tmp_path = self._path.with_suffix(".tmp")
@@ -192,19 +197,17 @@ class ConfigManager:
         return None
 
     def find_folder_for_app(self, exe_name: str) -> FolderConfig | None:
-        """DFS search for a folder mapped to the given app."""
-        exe_lower = exe_name.lower()
-        return self._find_folder_for_app(self._config.root_folder, exe_lower)
+        """Folder mapped to the given app (first match in DFS order)."""
+        if self._app_folders is None:
+            self._app_folders = {}
+            self._index_app_folders(self._config.root_folder)
+        return self._app_folders.get(exe_name.lower())
 
-    def _find_folder_for_app(self, folder: FolderConfig, exe_lower: str) -> FolderConfig | None:
+    def _index_app_folders(self, folder: FolderConfig) -> None:
         for app in folder.mapped_apps:
-            if app.lower() == exe_lower:
-                return folder
+            self._app_folders.setdefault(app.lower(), folder)
         for child in folder.children:
-            result = self._find_folder_for_app(child, exe_lower)
-            if result is not None:
-                return result
-        return None
+            self._index_app_folders(child)
 
     def add_folder(self, parent_id: str, name: str = "New Folder") -> FolderConfig | None:
         """Create a new sub-folder under parent_id. Returns the new folder or None."""
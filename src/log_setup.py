@@ -0,0 +1,46 @@
+"""Process-wide logging, configured before Qt is imported."""
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+
+def setup_logging() -> None:
+    log_format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    handlers: list[logging.Handler] = []
+
+    # File log — always works, even in --windowed exe (no stdout).
+    # delay=True: the file is first opened by the listener thread
+    log_dir = os.path.join(
+        os.environ.get("APPDATA", "."), "SoftDeck"
+    )
+    os.makedirs(log_dir, exist_ok=True)
+    file_handler = logging.FileHandler(
+        os.path.join(log_dir, "app.log"), encoding="utf-8", delay=True,
+    )
+    handlers.append(file_handler)
+
+    # Console log — only when stdout exists (not --windowed exe)
+    if sys.stdout is not None:
+        handlers.append(logging.StreamHandler(sys.stdout))
+
+    formatter = logging.Formatter(log_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Callers only enqueue records; disk and console writes happen on
+    # the listener's thread so they never block the UI thread
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The queued record carries only the message (+ traceback); the
+    # listener's handlers apply log_format
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    # Flushes queued records on any exit path, including sys.exit()
+    atexit.register(listener.stop)
@@ -3,7 +3,6 @@ from __future__ import annotations
 import importlib
 import logging
 import os
-import pkgutil
 from typing import Any
 
 from .base import PluginBase, PluginEditorWidget
@@ -11,6 +10,20 @@ from .base import PluginBase, PluginEditorWidget
 logger = logging.getLogger(__name__)
 
 
+def _plugin_packages(plugins_dir: str) -> list[str]:
+    """Names of the sub-packages in plugins_dir, sorted.
+
+    One scandir of the directory (entry types come with the listing) plus
+    one stat per sub-directory for its __init__.py.
+    """
+    with os.scandir(plugins_dir) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if entry.is_dir() and "." not in entry.name
+            and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+        )
+
+
 class PluginLoader:
     """Discovers and manages plugins under src/plugins/*/."""
 
@@ -20,9 +33,7 @@ class PluginLoader:
     def discover_and_load(self) -> None:
         """Scan src/plugins/*/ for sub-packages exposing a Plugin class."""
         plugins_dir = os.path.dirname(os.path.abspath(__file__))
-        for importer, name, is_pkg in pkgutil.iter_modules([plugins_dir]):
-            if not is_pkg:
-                continue
+        for name in _plugin_packages(plugins_dir):
             try:
                 module = importlib.import_module(f".{name}", package=__package__)
                 plugin_cls = getattr(module, "Plugin", None)
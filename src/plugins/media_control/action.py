@@ -3,19 +3,22 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import keyboard
-
+from ...actions._send_input import KEYEVENTF_EXTENDEDKEY, chord_array, send
 from ...actions.base import ActionBase
 
 logger = logging.getLogger(__name__)
 
 
 class MediaControlAction(ActionBase):
+    # Media key press/release batches, built once for SendInput
     _MEDIA_KEYS = {
-        "play_pause": "play/pause media",
-        "next_track": "next track",
-        "prev_track": "previous track",
-        "stop": "stop media",
+        command: chord_array([(vk, KEYEVENTF_EXTENDEDKEY)])
+        for command, vk in (
+            ("play_pause", 0xB3),  # VK_MEDIA_PLAY_PAUSE
+            ("next_track", 0xB0),  # VK_MEDIA_NEXT_TRACK
+            ("prev_track", 0xB1),  # VK_MEDIA_PREV_TRACK
+            ("stop", 0xB2),        # VK_MEDIA_STOP
+        )
     }
 
     def __init__(self) -> None:
@@ -44,12 +47,12 @@ class MediaControlAction(ActionBase):
                 if self._media_service:
                     self._media_service.toggle_mic_mute()
             elif command == "now_playing":
-                keyboard.send(self._MEDIA_KEYS["play_pause"])
+                send(self._MEDIA_KEYS["play_pause"])
             elif command == "audio_device_switch":
                 if self._media_service:
                     self._media_service.cycle_audio_output_device()
             elif command in self._MEDIA_KEYS:
-                keyboard.send(self._MEDIA_KEYS[command])
+                send(self._MEDIA_KEYS[command])
             else:
                 logger.warning("Unknown media command: %s", command)
                 return
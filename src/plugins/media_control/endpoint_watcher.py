@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from pycaw.constants import ERole
+from pycaw.pycaw import AudioUtilities
+
+from .service import MediaControlService
+
+logger = logging.getLogger(__name__)
+
+# Core Audio notification callbacks (newer pycaw releases only)
+_HAS_CALLBACKS = False
+try:
+    from pycaw.callbacks import AudioEndpointVolumeCallback, MMNotificationClient
+    _HAS_CALLBACKS = True
+except Exception:
+    logger.debug("pycaw callbacks not available — audio state will be polled")
+
+
+if _HAS_CALLBACKS:
+    class _VolumeCallback(AudioEndpointVolumeCallback):
+        """IAudioEndpointVolumeCallback forwarding the mute flag to a signal."""
+
+        def __init__(self, signal: Any) -> None:
+            super().__init__()
+            self._signal = signal
+
+        def on_notify(self, new_volume, new_mute, event_context, channels, channel_volumes) -> None:
+            self._signal.emit(bool(new_mute))
+
+    class _DeviceClient(MMNotificationClient):
+        """IMMNotificationClient reporting default device changes to a signal."""
+
+        def __init__(self, signal: Any) -> None:
+            super().__init__()
+            self._signal = signal
+
+        def on_default_device_changed(self, flow, flow_id, role, role_id, default_device_id) -> None:
+            # Fires once per role; the service tracks the multimedia endpoints
+            if role_id == ERole.eMultimedia.value:
+                self._signal.emit()
+
+
+class AudioEndpointWatcher(QObject):
+    """Core Audio change notifications for mute, mic mute and the output device.
+
+    Callbacks arrive on COM worker threads; the signals are queued to the
+    receivers' (main) thread.
+    """
+
+    mute_changed = pyqtSignal(bool)
+    mic_mute_changed = pyqtSignal(bool)
+    device_name_changed = pyqtSignal(str)
+    _default_device_changed = pyqtSignal()
+
+    def __init__(self, service: MediaControlService) -> None:
+        super().__init__()
+        self._service = service
+        self._enumerator = None
+        self._device_client = None
+        self._volume_callback = None
+        self._mic_callback = None
+        # Endpoint interfaces our volume callbacks are registered on
+        self._watched_volume = None
+        self._watched_mic = None
+        self._default_device_changed.connect(self._on_default_device_changed)
+
+    def start(self) -> bool:
+        """Register for notifications. Returns False if polling is still needed."""
+        if not _HAS_CALLBACKS:
+            return False
+        try:
+            self._volume_callback = _VolumeCallback(self.mute_changed)
+            self._mic_callback = _VolumeCallback(self.mic_mute_changed)
+            self._device_client = _DeviceClient(self._default_device_changed)
+            self._enumerator = AudioUtilities.GetDeviceEnumerator()
+            self._enumerator.RegisterEndpointNotificationCallback(self._device_client)
+        except Exception:
+            logger.debug("Failed to register audio device notifications", exc_info=True)
+            self._enumerator = None
+            return False
+        self._watch_endpoints()
+        return True
+
+    def stop(self) -> None:
+        self._unwatch_endpoints()
+        if self._enumerator is not None:
+            try:
+                self._enumerator.UnregisterEndpointNotificationCallback(self._device_client)
+            except Exception:
+                logger.debug("Failed to unregister audio device notifications", exc_info=True)
+            self._enumerator = None
+
+    def _watch_endpoints(self) -> None:
+        self._watched_volume = self._service.endpoint_volume
+        self._watched_mic = self._service.mic_endpoint_volume
+        for interface, callback in (
+            (self._watched_volume, self._volume_callback),
+            (self._watched_mic, self._mic_callback),
+        ):
+            if interface is None:
+                continue
+            try:
+                interface.RegisterControlChangeNotify(callback)
+            except Exception:
+                logger.debug("Failed to register volume notifications", exc_info=True)
+
+    def _unwatch_endpoints(self) -> None:
+        for interface, callback in (
+            (self._watched_volume, self._volume_callback),
+            (self._watched_mic, self._mic_callback),
+        ):
+            if interface is None:
+                continue
+            try:
+                interface.UnregisterControlChangeNotify(callback)
+            except Exception:
+                logger.debug("Failed to unregister volume notifications", exc_info=True)
+        self._watched_volume = None
+        self._watched_mic = None
+
+    def _on_default_device_changed(self) -> None:
+        # Runs on the main thread: move the callbacks to the new endpoints
+        self._unwatch_endpoints()
+        self._service.reinit_endpoints()
+        self._watch_endpoints()
+        self.mute_changed.emit(self._service.is_muted())
+        self.mic_mute_changed.emit(self._service.is_mic_muted())
+        self.device_name_changed.emit(self._service.get_current_audio_output_name())
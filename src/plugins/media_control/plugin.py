@@ -6,6 +6,7 @@ from typing import Any
 
 from ..base import PluginBase, PluginEditorWidget
 from .action import MediaControlAction
+from .endpoint_watcher import AudioEndpointWatcher
 from .service import MediaControlService
 from .editor import MediaControlEditorWidget
 from .playback_monitor import MediaPlaybackMonitor
@@ -37,6 +38,7 @@ class MediaControlPlugin(PluginBase):
     def __init__(self) -> None:
         self._service: MediaControlService | None = None
         self._playback_monitor: MediaPlaybackMonitor | None = None
+        self._endpoint_watcher: AudioEndpointWatcher | None = None
         self._is_playing: bool = False
         self._is_muted: bool = False
         self._is_mic_muted: bool = False
@@ -50,10 +52,14 @@ class MediaControlPlugin(PluginBase):
     def initialize(self) -> None:
         self._service = MediaControlService()
         self._playback_monitor = MediaPlaybackMonitor()
+        self._endpoint_watcher = AudioEndpointWatcher(self._service)
 
     def get_playback_monitor(self) -> MediaPlaybackMonitor | None:
         return self._playback_monitor
 
+    def get_endpoint_watcher(self) -> AudioEndpointWatcher | None:
+        return self._endpoint_watcher
+
     def get_service(self) -> MediaControlService | None:
         return self._service
 
@@ -104,6 +110,9 @@ class MediaControlPlugin(PluginBase):
         return ""
 
     def shutdown(self) -> None:
+        if self._endpoint_watcher is not None:
+            self._endpoint_watcher.stop()
+            self._endpoint_watcher = None
         if self._playback_monitor is not None:
             self._playback_monitor.stop()
             self._playback_monitor = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from typing import NamedTuple
 
 from pycaw.constants import EDataFlow, ERole, DEVICE_STATE
 from pycaw.pycaw import AudioUtilities
@@ -8,10 +9,17 @@ from pycaw.pycaw import AudioUtilities
 logger = logging.getLogger(__name__)
 
 
+class AudioSnapshot(NamedTuple):
+    muted: bool
+    mic_muted: bool
+    device_name: str | None  # None when not requested
+
+
 class MediaControlService:
     def __init__(self) -> None:
         self._volume_interface = None
         self._mic_volume_interface = None
+        self._enumerator = None
         self._init_audio()
         self._init_microphone()
 
@@ -32,6 +40,21 @@ class MediaControlService:
         except Exception:
             logger.debug("Failed to initialize microphone endpoint", exc_info=True)
 
+    @property
+    def endpoint_volume(self):
+        """IAudioEndpointVolume of the default output device, or None."""
+        return self._volume_interface
+
+    @property
+    def mic_endpoint_volume(self):
+        """IAudioEndpointVolume of the default microphone, or None."""
+        return self._mic_volume_interface
+
+    def reinit_endpoints(self) -> None:
+        """Re-acquire both endpoints after the default devices change."""
+        self._init_audio()
+        self._init_microphone()
+
     def get_volume(self) -> float:
         if self._volume_interface is None:
             return 0.0
@@ -93,8 +116,22 @@ class MediaControlService:
         except Exception:
             return False
 
+    def get_audio_snapshot(self, with_device_name: bool = True) -> AudioSnapshot:
+        """Speaker mute, mic mute and (optionally) output device name in one call."""
+        return AudioSnapshot(
+            self.is_muted(),
+            self.is_mic_muted(),
+            self.get_current_audio_output_name() if with_device_name else None,
+        )
+
     # --- Audio output device switching ---
 
+    def _device_enumerator(self):
+        # IMMDeviceEnumerator, created once and reused for default-device lookups
+        if self._enumerator is None:
+            self._enumerator = AudioUtilities.GetDeviceEnumerator()
+        return self._enumerator
+
     def get_audio_output_devices(self) -> list[tuple[str, str]]:
         """Return list of (device_id, friendly_name) for active render endpoints."""
         try:
@@ -109,8 +146,7 @@ class MediaControlService:
 
     def get_default_audio_output_device_id(self) -> str:
         try:
-            enumerator = AudioUtilities.GetDeviceEnumerator()
-            device = enumerator.GetDefaultAudioEndpoint(
+            device = self._device_enumerator().GetDefaultAudioEndpoint(
                 EDataFlow.eRender.value, ERole.eMultimedia.value,
             )
             return device.GetId()
@@ -147,8 +183,7 @@ class MediaControlService:
 
     def get_current_audio_output_name(self) -> str:
         try:
-            enumerator = AudioUtilities.GetDeviceEnumerator()
-            device = enumerator.GetDefaultAudioEndpoint(
+            device = self._device_enumerator().GetDefaultAudioEndpoint(
                 EDataFlow.eRender.value, ERole.eMultimedia.value,
             )
             audio_device = AudioUtilities.CreateDevice(device)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 
 import psutil
 from PyQt6.QtCore import QThread, pyqtSignal
@@ -15,22 +16,40 @@ class SystemStatsService(QThread):
         super().__init__()
         self._interval_ms = interval_ms
         self._running = True
+        # Cleared while nobody can see the stats (main window hidden)
+        self._active = threading.Event()
+        self._active.set()
 
     def run(self) -> None:
-        # First call to initialize cpu_percent
-        psutil.cpu_percent(interval=None)
-
         while self._running:
-            try:
-                cpu = psutil.cpu_percent(interval=None)
-                ram = psutil.virtual_memory().percent
-                self.stats_updated.emit(cpu, ram)
-            except Exception:
-                logger.exception("Failed to collect system stats")
-
-            self.msleep(self._interval_ms)
+            if not self._active.is_set():
+                self._active.wait()
+                if not self._running:
+                    break
+            # cpu_percent(None) measures since the previous call, so prime it
+            # after startup or a pause instead of reporting the idle stretch
+            psutil.cpu_percent(interval=None)
+            self.msleep(min(self._interval_ms, 500))
+
+            while self._running and self._active.is_set():
+                try:
+                    cpu = psutil.cpu_percent(interval=None)
+                    ram = psutil.virtual_memory().percent
+                    self.stats_updated.emit(cpu, ram)
+                except Exception:
+                    logger.exception("Failed to collect system stats")
+
+                self.msleep(self._interval_ms)
+
+    def pause(self) -> None:
+        """Stop sampling until resume(); the thread blocks without waking."""
+        self._active.clear()
+
+    def resume(self) -> None:
+        self._active.set()
 
     def stop(self) -> None:
         self._running = False
+        self._active.set()
         self.quit()
         self.wait(3000)
@@ -1,49 +1,146 @@
 from __future__ import annotations
 
+import ctypes
+import ctypes.wintypes
 import logging
 import os
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
 _OWN_PID = os.getpid()
 
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_IMAGE_NAME_CHARS = 1024
+_EVENT_SYSTEM_FOREGROUND = 0x0003
+_WINEVENT_OUTOFCONTEXT = 0x0000
+# Foreground polling interval, used only if the WinEvent hook can't be installed
+_FALLBACK_POLL_MS = 300
+
+_WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD, ctypes.wintypes.HWND,
+    ctypes.wintypes.LONG, ctypes.wintypes.LONG, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+)
+
+_user32 = ctypes.windll.user32
+_user32.GetForegroundWindow.argtypes = []
+_user32.GetForegroundWindow.restype = ctypes.wintypes.HWND
+_user32.GetWindowThreadProcessId.argtypes = [
+    ctypes.wintypes.HWND, ctypes.POINTER(ctypes.wintypes.DWORD),
+]
+_user32.GetWindowThreadProcessId.restype = ctypes.wintypes.DWORD
+_user32.SetWinEventHook.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.HMODULE,
+    _WINEVENTPROC, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD,
+]
+_user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+_user32.UnhookWinEvent.argtypes = [ctypes.wintypes.HANDLE]
+_user32.UnhookWinEvent.restype = ctypes.wintypes.BOOL
+
+_kernel32 = ctypes.windll.kernel32
+_kernel32.OpenProcess.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD,
+]
+_kernel32.OpenProcess.restype = ctypes.wintypes.HANDLE
+_kernel32.QueryFullProcessImageNameW.argtypes = [
+    ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD,
+    ctypes.wintypes.LPWSTR, ctypes.POINTER(ctypes.wintypes.DWORD),
+]
+_kernel32.QueryFullProcessImageNameW.restype = ctypes.wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+_kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+
+
+def _window_pid(hwnd: int) -> int:
+    pid = ctypes.wintypes.DWORD()
+    _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value
+
+
+def foreground_pid() -> int:
+    """PID owning the foreground window, or 0 if there is none."""
+    hwnd = _user32.GetForegroundWindow()
+    return _window_pid(hwnd) if hwnd else 0
+
+
+def process_exe_name(pid: int) -> str:
+    """Executable file name of a process (e.g. "chrome.exe"), or "" if unavailable."""
+    handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ""
+    try:
+        buf = ctypes.create_unicode_buffer(_IMAGE_NAME_CHARS)
+        size = ctypes.wintypes.DWORD(_IMAGE_NAME_CHARS)
+        if not _kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            return ""
+        return os.path.basename(buf.value)
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+class ActiveWindowMonitor(QObject):
+    """Emits the foreground app's exe name whenever the foreground window changes.
+
+    Uses an out-of-context EVENT_SYSTEM_FOREGROUND WinEvent hook: Windows
+    calls back on the installing (main) thread from its message loop, so
+    nothing polls and no extra thread is needed. If the hook can't be
+    installed, the foreground window is polled on a timer instead.
+    """
 
-class ActiveWindowMonitor(QThread):
     active_app_changed = pyqtSignal(str)  # exe_name
 
-    def __init__(self, interval_ms: int = 300) -> None:
+    def __init__(self) -> None:
         super().__init__()
-        self._interval_ms = interval_ms
-        self._running = True
+        self._hook = None
+        self._poll_timer: QTimer | None = None
         self._last_exe = ""
+        # Must stay referenced for as long as the hook is installed
+        self._callback = _WINEVENTPROC(self._on_foreground_event)
 
-    def run(self) -> None:
-        import win32gui
-        import win32process
-        import psutil as _psutil
-
-        while self._running:
-            try:
-                hwnd = win32gui.GetForegroundWindow()
-                if hwnd:
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    if pid and pid != _OWN_PID:
-                        try:
-                            proc = _psutil.Process(pid)
-                            exe_name = proc.name()
-                            if exe_name != self._last_exe:
-                                self._last_exe = exe_name
-                                self.active_app_changed.emit(exe_name)
-                        except (_psutil.NoSuchProcess, _psutil.AccessDenied):
-                            pass
-            except Exception:
-                pass  # Window may have closed between check and query
-
-            self.msleep(self._interval_ms)
+    def start(self) -> None:
+        if self._hook or self._poll_timer is not None:
+            return
+        self._hook = _user32.SetWinEventHook(
+            _EVENT_SYSTEM_FOREGROUND, _EVENT_SYSTEM_FOREGROUND, None,
+            self._callback, 0, 0, _WINEVENT_OUTOFCONTEXT,
+        )
+        if not self._hook:
+            logger.warning("Failed to install foreground window hook — polling instead")
+            self._poll_timer = QTimer(self)
+            self._poll_timer.timeout.connect(self._poll_foreground)
+            self._poll_timer.start(_FALLBACK_POLL_MS)
+        # Report the app that is already in front
+        self._poll_foreground()
 
     def stop(self) -> None:
-        self._running = False
-        self.quit()
-        self.wait(3000)
+        if self._hook:
+            _user32.UnhookWinEvent(self._hook)
+            self._hook = None
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+            self._poll_timer = None
+
+    def _poll_foreground(self) -> None:
+        try:
+            self._check_window(_user32.GetForegroundWindow())
+        except Exception:
+            pass  # Window may have closed mid-query
+
+    def _on_foreground_event(self, hook, event, hwnd, id_object, id_child, thread_id, time_ms) -> None:
+        try:
+            self._check_window(hwnd)
+        except Exception:
+            pass  # Window may have closed between the event and the query
+
+    def _check_window(self, hwnd: int) -> None:
+        if not hwnd:
+            return
+        pid = _window_pid(hwnd)
+        if not pid or pid == _OWN_PID:
+            return
+        exe_name = process_exe_name(pid)
+        if exe_name and exe_name != self._last_exe:
+            self._last_exe = exe_name
+            self.active_app_changed.emit(exe_name)
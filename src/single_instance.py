@@ -0,0 +1,202 @@
+"""Single-instance enforcement, settled before Qt is imported.
+
+Only ctypes and the standard library are used here, so a duplicate launch
+that has to hand over from (or replace) a running instance does so without
+paying for PyQt6's DLL loads and platform plugin init.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+_OWN_PID = os.getpid()
+
+MUTEX_NAME = "SoftDeck_SingleInstance"
+# Auto-reset event the running instance waits on; a newer instance sets it
+QUIT_EVENT_NAME = "SoftDeck_QuitRequest"
+
+_SYNCHRONIZE = 0x00100000
+_EVENT_MODIFY_STATE = 0x0002
+_PROCESS_TERMINATE = 0x0001
+_ERROR_ALREADY_EXISTS = 183
+_WAIT_OBJECT_0 = 0
+_WAIT_ABANDONED = 0x80
+# How long a running instance gets to clean up after a quit request
+_QUIT_TIMEOUT_MS = 5000
+_TH32CS_SNAPPROCESS = 0x00000002
+_INVALID_HANDLE_VALUE = ctypes.wintypes.HANDLE(-1).value
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize",              ctypes.wintypes.DWORD),
+        ("cntUsage",            ctypes.wintypes.DWORD),
+        ("th32ProcessID",       ctypes.wintypes.DWORD),
+        ("th32DefaultHeapID",   ctypes.c_size_t),
+        ("th32ModuleID",        ctypes.wintypes.DWORD),
+        ("cntThreads",          ctypes.wintypes.DWORD),
+        ("th32ParentProcessID", ctypes.wintypes.DWORD),
+        ("pcPriClassBase",      ctypes.wintypes.LONG),
+        ("dwFlags",             ctypes.wintypes.DWORD),
+        ("szExeFile",           ctypes.c_wchar * ctypes.wintypes.MAX_PATH),
+    ]
+
+
+_kernel32 = ctypes.windll.kernel32
+_kernel32.OpenMutexW.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.LPCWSTR,
+]
+_kernel32.OpenMutexW.restype = ctypes.wintypes.HANDLE
+_kernel32.CreateMutexW.argtypes = [
+    ctypes.c_void_p, ctypes.wintypes.BOOL, ctypes.wintypes.LPCWSTR,
+]
+_kernel32.CreateMutexW.restype = ctypes.wintypes.HANDLE
+_kernel32.ReleaseMutex.argtypes = [ctypes.wintypes.HANDLE]
+_kernel32.ReleaseMutex.restype = ctypes.wintypes.BOOL
+_kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+_kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+_kernel32.OpenEventW.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.LPCWSTR,
+]
+_kernel32.OpenEventW.restype = ctypes.wintypes.HANDLE
+_kernel32.SetEvent.argtypes = [ctypes.wintypes.HANDLE]
+_kernel32.SetEvent.restype = ctypes.wintypes.BOOL
+_kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+_kernel32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+_kernel32.Process32FirstW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+_kernel32.Process32FirstW.restype = ctypes.wintypes.BOOL
+_kernel32.Process32NextW.argtypes = [ctypes.wintypes.HANDLE, ctypes.POINTER(_PROCESSENTRY32W)]
+_kernel32.Process32NextW.restype = ctypes.wintypes.BOOL
+_kernel32.OpenProcess.argtypes = [
+    ctypes.wintypes.DWORD, ctypes.wintypes.BOOL, ctypes.wintypes.DWORD,
+]
+_kernel32.OpenProcess.restype = ctypes.wintypes.HANDLE
+_kernel32.TerminateProcess.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.UINT]
+_kernel32.TerminateProcess.restype = ctypes.wintypes.BOOL
+_kernel32.WaitForSingleObject.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD]
+_kernel32.WaitForSingleObject.restype = ctypes.wintypes.DWORD
+
+# Held (and owned by the main thread) for the life of the process once acquired
+_mutex_handle: int | None = None
+
+
+def try_acquire_mutex() -> bool:
+    """Take the single-instance mutex; False if another instance holds it.
+
+    The mutex is created owned, so a newer instance can block on it until
+    this one releases it (or dies) instead of polling for it to disappear.
+    """
+    global _mutex_handle
+    if _mutex_handle:
+        return True
+    # Probe first: if another instance holds the mutex, one OpenMutexW
+    # call answers without creating a kernel object
+    existing = _kernel32.OpenMutexW(_SYNCHRONIZE, False, MUTEX_NAME)
+    if existing:
+        _kernel32.CloseHandle(existing)
+        return False
+    handle = _kernel32.CreateMutexW(None, True, MUTEX_NAME)
+    if not handle:  # e.g. ERROR_ACCESS_DENIED from another session's mutex
+        return False
+    if _kernel32.GetLastError() == _ERROR_ALREADY_EXISTS:  # lost a race
+        _kernel32.CloseHandle(handle)
+        return False
+    _mutex_handle = handle
+    return True
+
+
+def release_mutex() -> None:
+    """Release and close the mutex; must run on the thread that acquired it."""
+    global _mutex_handle
+    if _mutex_handle:
+        _kernel32.ReleaseMutex(_mutex_handle)
+        _kernel32.CloseHandle(_mutex_handle)
+        _mutex_handle = None
+
+
+def request_existing_quit() -> bool:
+    """Signal the running instance's quit event; False if it has none."""
+    handle = _kernel32.OpenEventW(_EVENT_MODIFY_STATE, False, QUIT_EVENT_NAME)
+    if not handle:
+        return False
+    try:
+        return bool(_kernel32.SetEvent(handle))
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def kill_existing() -> None:
+    """Terminate other softdeck.exe processes.
+
+    Fallback only — instances with a quit-request event are asked to exit.
+    One Toolhelp snapshot; a handle is opened only for name matches.
+    """
+    snapshot = _kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot == _INVALID_HANDLE_VALUE:
+        logger.warning("Failed to snapshot processes")
+        return
+    try:
+        entry = _PROCESSENTRY32W(dwSize=ctypes.sizeof(_PROCESSENTRY32W))
+        found = _kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            pid = entry.th32ProcessID
+            if pid != _OWN_PID and entry.szExeFile.lower() == "softdeck.exe":
+                _terminate_pid(pid)
+            found = _kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _kernel32.CloseHandle(snapshot)
+
+
+def _terminate_pid(pid: int) -> None:
+    handle = _kernel32.OpenProcess(_PROCESS_TERMINATE | _SYNCHRONIZE, False, pid)
+    if not handle:
+        return  # already gone, or access denied
+    try:
+        if _kernel32.TerminateProcess(handle, 1):
+            _kernel32.WaitForSingleObject(handle, 3000)
+            logger.info("Terminated existing PID %d", pid)
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+def _wait_for_release() -> bool:
+    """Block until the running instance releases the mutex or exits."""
+    global _mutex_handle
+    handle = _kernel32.OpenMutexW(_SYNCHRONIZE, False, MUTEX_NAME)
+    if not handle:
+        # Already gone — it exited between the probe and now
+        return try_acquire_mutex()
+    # Either result leaves the mutex owned through our handle
+    if _kernel32.WaitForSingleObject(handle, _QUIT_TIMEOUT_MS) in (_WAIT_OBJECT_0, _WAIT_ABANDONED):
+        _mutex_handle = handle
+        return True
+    _kernel32.CloseHandle(handle)
+    return False
+
+
+def ensure_single_instance() -> bool:
+    """Become the only running instance, replacing an existing one.
+
+    Returns False if the mutex could not be acquired even after
+    terminating the other instance.
+    """
+    if try_acquire_mutex():
+        return True
+    if request_existing_quit():
+        logger.info("Another instance detected — asked it to quit")
+        acquired = _wait_for_release()
+    else:
+        acquired = False
+    if not acquired:
+        logger.info("Another instance detected — terminating it")
+        # Returns once each terminated process has exited (or after 3s)
+        kill_existing()
+        if not try_acquire_mutex():
+            logger.error("Failed to acquire mutex after killing existing process")
+            return False
+    logger.info("Mutex acquired from the previous instance")
+    return True
@@ -641,24 +641,14 @@ class MainWindow(QMainWindow):
         if folder is None or not folder.mapped_apps:
             return False
 
-        import ctypes
-        import psutil
+        from ..services.window_monitor import foreground_pid, process_exe_name
 
         target_set = {app.lower() for app in folder.mapped_apps}
 
         # Check if foreground app is already a mapped app
-        try:
-            fg_hwnd = ctypes.windll.user32.GetForegroundWindow()
-            if fg_hwnd:
-                import win32gui
-                import win32process
-                _, fg_pid = win32process.GetWindowThreadProcessId(fg_hwnd)
-                if fg_pid:
-                    fg_exe = psutil.Process(fg_pid).name().lower()
-                    if fg_exe in target_set:
-                        return False  # Already focused — no delay needed
-        except Exception:
-            pass
+        fg_pid = foreground_pid()
+        if fg_pid and process_exe_name(fg_pid).lower() in target_set:
+            return False  # Already focused — no delay needed
 
         target_hwnd = self._find_mapped_app_window(target_set)
         if target_hwnd is None:
@@ -672,11 +662,13 @@ class MainWindow(QMainWindow):
         import ctypes
         from ctypes import wintypes
         import win32process
-        import psutil
+        from ..services.window_monitor import process_exe_name
 
         user32 = ctypes.windll.user32
         our_hwnd = int(self.winId())
         result: list[int] = []
+        # Apps usually own several top-level windows; look each PID up once
+        exe_names: dict[int, str] = {}
 
         GWL_EXSTYLE = -20
         WS_EX_TOOLWINDOW = 0x00000080
@@ -696,7 +688,9 @@ class MainWindow(QMainWindow):
             try:
                 _, pid = win32process.GetWindowThreadProcessId(h)
                 if pid:
-                    exe = psutil.Process(pid).name().lower()
+                    exe = exe_names.get(pid)
+                    if exe is None:
+                        exe = exe_names[pid] = process_exe_name(pid).lower()
                     if exe in target_set:
                         result.append(h)
                         return False  # Found — stop enumeration
@@ -757,6 +751,8 @@ class MainWindow(QMainWindow):
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
+        if self._system_stats_service is not None:
+            self._system_stats_service.resume()
         # Reinforce WS_EX_NOACTIVATE so clicks never steal focus
         import ctypes
         GWL_EXSTYLE = -20
@@ -768,6 +764,12 @@ class MainWindow(QMainWindow):
                 hwnd, GWL_EXSTYLE, style | WS_EX_NOACTIVATE
             )
 
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        # No one sees the monitor buttons while hidden (tray / Num Lock ON)
+        if self._system_stats_service is not None:
+            self._system_stats_service.pause()
+
     def toggle_visibility(self) -> None:
         if self.isVisible() and not self.isMinimized():
             self._minimize_to_tray()
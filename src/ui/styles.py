@@ -578,15 +578,3 @@ def get_theme(name: str) -> ThemeStylesheets:
     _theme_cache[name] = theme
     return theme
 
-
-# ---------------------------------------------------------------------------
-# Backward Compatibility — module-level constants for existing imports
-# ---------------------------------------------------------------------------
-
-_default = get_theme("dark")
-DARK_THEME = _default.dark_theme
-DECK_BUTTON_STYLE = _default.deck_button_style
-DECK_BUTTON_EMPTY_STYLE = _default.deck_button_empty_style
-MONITOR_BUTTON_STYLE = _default.monitor_button_style
-FOLDER_TREE_STYLE = _default.folder_tree_style
-TITLE_BAR_STYLE = _default.title_bar_style